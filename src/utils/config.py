@@ -23,18 +23,44 @@ objects, validating parameter ranges, and saving updated configurations back
 to disk.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
-import yaml
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field, fields, replace
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 import json
+import os
+import tempfile
 from pathlib import Path
-import numpy as np
+
+# numpy costs ~100ms (plus BLAS) at import; it is only needed once a
+# WorkloadConfig is actually constructed, so it is imported there instead
+# of at module scope.
+if TYPE_CHECKING:
+    import numpy as np
 
 # We do a local import for WorkloadType within from_dict, so let's import it here.
 from ..environment import TopologyConfig, WorkloadType
 
+# Prefer libyaml's C implementations when PyYAML was built against it; the
+# pure-Python loader/dumper is the fallback. PyYAML itself is imported on
+# first YAML use so JSON-only callers never pay its import cost.
+_YAML_LOADER = None
+_YAML_DUMPER = None
+
 
-@dataclass
+def _load_yaml_module():
+    """Import PyYAML lazily, resolving the C loader/dumper once."""
+    global _YAML_LOADER, _YAML_DUMPER
+    import yaml
+    if _YAML_LOADER is None:
+        _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        _YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return yaml
+
+
+@dataclass(slots=True)
 class NetworkConfig:
     """Network topology configuration"""
     topology_type: str  # e.g. "edge_cluster", "distributed_edge", or "hybrid_cloud_edge"
@@ -45,7 +71,7 @@ class NetworkConfig:
     seed: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceConfig:
     """Resource distribution configuration"""
     memory_mu: float
@@ -59,7 +85,7 @@ class ResourceConfig:
     seed: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkloadConfig:
     """Workload generation configuration"""
     model_type: WorkloadType
@@ -67,9 +93,40 @@ class WorkloadConfig:
     generation_steps: List[int]
     precision_bytes: int = 4
     seed: Optional[int] = None
+    # NumPy views of the two step lists, so repeated validations during
+    # parameter sweeps check positivity in a single vectorized pass instead
+    # of a per-element Python loop. The source list objects are kept
+    # alongside the arrays so a reassigned list is detected (by identity)
+    # and the arrays rebuilt rather than validated stale.
+    _sequence_lengths_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _generation_steps_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _sequence_lengths_src: List[int] = field(init=False, repr=False, compare=False)
+    _generation_steps_src: List[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._refresh_arrays()
+
+    def _refresh_arrays(self) -> None:
+        import numpy as np
+        self._sequence_lengths_arr = np.asarray(
+            self.initial_sequence_lengths, dtype=np.int64
+        )
+        self._generation_steps_arr = np.asarray(
+            self.generation_steps, dtype=np.int64
+        )
+        self._sequence_lengths_src = self.initial_sequence_lengths
+        self._generation_steps_src = self.generation_steps
+
+    def _arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the cached arrays, rebuilding them first if either
+        backing list has been reassigned since they were computed."""
+        if (self._sequence_lengths_src is not self.initial_sequence_lengths
+                or self._generation_steps_src is not self.generation_steps):
+            self._refresh_arrays()
+        return self._sequence_lengths_arr, self._generation_steps_arr
 
 
-@dataclass
+@dataclass(slots=True)
 class AlgorithmConfig:
     """Algorithm configuration parameters"""
     migration_threshold: float = 0.9
@@ -78,7 +135,7 @@ class AlgorithmConfig:
     enable_dynamic_adjustment: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperimentConfig:
     """Experiment configuration"""
     name: str
@@ -90,7 +147,7 @@ class ExperimentConfig:
     save_intermediate: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationConfig:
     """Complete simulation configuration"""
     network: NetworkConfig
@@ -118,14 +175,16 @@ class SimulationConfig:
             seed=r.get('seed', None)
         )
 
-        w = config_dict['workload']
-        workload = WorkloadConfig(
-            model_type=WorkloadType[w['model_type']],  # e.g. "SMALL" => WorkloadType.SMALL
-            initial_sequence_lengths=w['initial_sequence_lengths'],
-            generation_steps=w['generation_steps'],
-            precision_bytes=w.get('precision_bytes', 4),
-            seed=w.get('seed', None)
-        )
+        # e.g. "SMALL" => WorkloadType.SMALL; known keys map 1:1 onto
+        # WorkloadConfig fields, with dataclass defaults filling any gaps.
+        # Unknown keys (e.g. comments in a hand-edited config) are ignored,
+        # as they are for the other sections.
+        w = {
+            k: v for k, v in config_dict['workload'].items()
+            if k in _SECTION_FIELDS['workload']
+        }
+        model_type = WorkloadType[w.pop('model_type')]
+        workload = WorkloadConfig(model_type=model_type, **w)
 
         net = config_dict['network']
         network = NetworkConfig(
@@ -175,50 +234,38 @@ class SimulationConfig:
         return load_config(config_path)
 
     def to_dict(self) -> Dict:
-        """Convert configuration to dictionary"""
-        return {
-            'network': {
-                'topology_type': self.network.topology_type,
-                'num_devices': self.network.num_devices,
-                'min_bandwidth': self.network.min_bandwidth,
-                'max_bandwidth': self.network.max_bandwidth,
-                'edge_probability': self.network.edge_probability,
-                'seed': self.network.seed
-            },
-            'resources': {
-                'memory_mu': self.resources.memory_mu,
-                'memory_sigma': self.resources.memory_sigma,
-                'memory_min': self.resources.memory_min,
-                'memory_max': self.resources.memory_max,
-                'compute_mu': self.resources.compute_mu,
-                'compute_sigma': self.resources.compute_sigma,
-                'compute_min': self.resources.compute_min,
-                'compute_max': self.resources.compute_max,
-                'seed': self.resources.seed
-            },
-            'workload': {
-                'model_type': self.workload.model_type.name,
-                'initial_sequence_lengths': self.workload.initial_sequence_lengths,
-                'generation_steps': self.workload.generation_steps,
-                'precision_bytes': self.workload.precision_bytes,
-                'seed': self.workload.seed
-            },
-            'algorithm': {
-                'migration_threshold': self.algorithm.migration_threshold,
-                'backtrack_limit': self.algorithm.backtrack_limit,
-                'cache_placement_strategy': self.algorithm.cache_placement_strategy,
-                'enable_dynamic_adjustment': self.algorithm.enable_dynamic_adjustment
-            },
-            'experiment': {
-                'name': self.experiment.name,
-                'description': self.experiment.description,
-                'num_runs': self.experiment.num_runs,
-                'checkpoint_interval': self.experiment.checkpoint_interval,
-                'time_limit': self.experiment.time_limit,
-                'metrics_output_dir': self.experiment.metrics_output_dir,
-                'save_intermediate': self.experiment.save_intermediate
-            }
+        """
+        Convert configuration to dictionary using the per-section key and
+        attrgetter tuples precomputed at import time, so no per-call field
+        discovery happens; only the WorkloadType enum needs fixing up to
+        its serializable name.
+        """
+        config_dict = {
+            section: dict(zip(keys, (getter(getattr(self, section))
+                                     for getter in getters)))
+            for section, keys, getters in _SECTION_SERIALIZERS
         }
+        config_dict['workload']['model_type'] = self.workload.model_type.name
+        return config_dict
+
+
+# Per-section (name, keys, attrgetters) tuples for to_dict, computed once
+# at import: codegen once, dispatch fast. The underscore-prefixed cached
+# array fields on WorkloadConfig are derived state and are excluded.
+def _section_serializer(section_name, section_cls):
+    keys = tuple(
+        f.name for f in fields(section_cls) if not f.name.startswith('_')
+    )
+    return section_name, keys, tuple(attrgetter(key) for key in keys)
+
+
+_SECTION_SERIALIZERS = (
+    _section_serializer('network', NetworkConfig),
+    _section_serializer('resources', ResourceConfig),
+    _section_serializer('workload', WorkloadConfig),
+    _section_serializer('algorithm', AlgorithmConfig),
+    _section_serializer('experiment', ExperimentConfig),
+)
 
 
 def create_default_config() -> SimulationConfig:
@@ -253,23 +300,89 @@ def create_default_config() -> SimulationConfig:
     )
 
 
+def _load_yaml_with_sidecar(config_path: Path, stat) -> Dict:
+    """
+    Parse a YAML config, reading a JSON sidecar cache when it is at least as
+    new as the YAML file. JSON parses far faster than YAML, so repeated loads
+    of an unedited config bypass the YAML parser entirely. The sidecar is
+    rewritten after every YAML parse; a stale sidecar is invalidated purely
+    by the mtime comparison.
+    """
+    sidecar_path = config_path.with_name(config_path.name + '.cache.json')
+    try:
+        if sidecar_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+            with open(sidecar_path, 'r') as f:
+                return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        # Missing or corrupt sidecar: fall through to the YAML parse.
+        pass
+
+    yaml = _load_yaml_module()
+    with open(config_path, 'r') as f:
+        config_dict = yaml.load(f, Loader=_YAML_LOADER)
+
+    # Write the sidecar atomically: dump to a temp file in the same
+    # directory, then os.replace() it into place. A crash or serialization
+    # error mid-write must never leave a truncated sidecar that is newer
+    # than the YAML, and concurrent readers only ever see complete files.
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=config_path.parent, prefix=sidecar_path.name + '.'
+        )
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(config_dict, f)
+            os.replace(tmp_name, sidecar_path)
+        except Exception:
+            os.unlink(tmp_name)
+            raise
+    except (OSError, TypeError):
+        # Best effort only; e.g. the config may live in a read-only directory.
+        pass
+
+    return config_dict
+
+
+# Cache of parsed configurations keyed by (resolved path, mtime_ns, size),
+# so repeated loads of an unchanged file skip parsing entirely. Editing the
+# file changes its mtime/size and naturally invalidates the entry.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], SimulationConfig] = {}
+
+
 def load_config(config_path: Union[str, Path]) -> SimulationConfig:
     """
     Load configuration from a YAML or JSON file, returning a SimulationConfig.
+
+    Parsed results are cached by (path, mtime, size); repeated loads of an
+    unchanged file return a copy of the cached configuration without
+    re-parsing. Use load_config.cache_clear() to drop cached entries.
     """
     config_path = Path(config_path)
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(config_path, 'r') as f:
-        if config_path.suffix == '.yaml':
-            config_dict = yaml.safe_load(f)
-        elif config_path.suffix == '.json':
+
+    stat = config_path.stat()
+    cache_key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        # Deep-copy so callers that mutate the returned config cannot
+        # corrupt the cached instance.
+        return copy.deepcopy(cached)
+
+    if config_path.suffix == '.yaml':
+        config_dict = _load_yaml_with_sidecar(config_path, stat)
+    elif config_path.suffix == '.json':
+        with open(config_path, 'r') as f:
             config_dict = json.load(f)
-        else:
-            raise ValueError("Configuration file must be .yaml or .json")
-    
-    return SimulationConfig.from_dict(config_dict)
+    else:
+        raise ValueError("Configuration file must be .yaml or .json")
+
+    config = SimulationConfig.from_dict(config_dict)
+    _CONFIG_CACHE[cache_key] = config
+    return copy.deepcopy(config)
+
+
+load_config.cache_clear = _CONFIG_CACHE.clear
 
 
 def save_config(config: SimulationConfig, config_path: Union[str, Path]) -> None:
@@ -283,73 +396,89 @@ def save_config(config: SimulationConfig, config_path: Union[str, Path]) -> None
     
     with open(config_path, 'w') as f:
         if config_path.suffix == '.yaml':
-            yaml.safe_dump(config_dict, f, default_flow_style=False)
+            yaml = _load_yaml_module()
+            yaml.dump(config_dict, f, Dumper=_YAML_DUMPER, default_flow_style=False)
         elif config_path.suffix == '.json':
             json.dump(config_dict, f, indent=2)
         else:
             raise ValueError("Configuration file must be .yaml or .json")
 
 
+# Validation predicates, compiled once at import. validate_config evaluates
+# them lazily so the first failing check short-circuits the rest.
+_VALIDATORS = (
+    # Network config
+    lambda c: c.network.num_devices > 0,
+    lambda c: c.network.min_bandwidth > 0 and c.network.max_bandwidth > 0,
+    lambda c: c.network.min_bandwidth <= c.network.max_bandwidth,
+    lambda c: 0 <= c.network.edge_probability <= 1,
+    # Resource config
+    lambda c: all(x > 0 for x in (
+        c.resources.memory_min, c.resources.memory_max,
+        c.resources.compute_min, c.resources.compute_max
+    )),
+    lambda c: c.resources.memory_min <= c.resources.memory_max,
+    lambda c: c.resources.compute_min <= c.resources.compute_max,
+    # Workload config
+    lambda c: bool(c.workload.initial_sequence_lengths),
+    lambda c: bool(c.workload.generation_steps),
+    lambda c: bool((c.workload._arrays()[0] > 0).all()),
+    lambda c: bool((c.workload._arrays()[1] > 0).all()),
+    lambda c: c.workload.precision_bytes > 0,
+    # Algorithm config
+    lambda c: 0 <= c.algorithm.migration_threshold <= 1,
+    lambda c: c.algorithm.backtrack_limit > 0,
+    # Experiment config
+    lambda c: c.experiment.num_runs > 0,
+    lambda c: c.experiment.checkpoint_interval > 0,
+    lambda c: c.experiment.time_limit > 0,
+)
+
+
 def validate_config(config: SimulationConfig) -> bool:
     """Validate configuration parameters"""
     try:
-        # Validate network config
-        if config.network.num_devices <= 0:
-            return False
-        if config.network.min_bandwidth <= 0 or config.network.max_bandwidth <= 0:
-            return False
-        if config.network.min_bandwidth > config.network.max_bandwidth:
-            return False
-        if not (0 <= config.network.edge_probability <= 1):
-            return False
-        
-        # Validate resource config
-        if any(x <= 0 for x in [
-            config.resources.memory_min, config.resources.memory_max,
-            config.resources.compute_min, config.resources.compute_max
-        ]):
-            return False
-        if config.resources.memory_min > config.resources.memory_max:
-            return False
-        if config.resources.compute_min > config.resources.compute_max:
-            return False
-        
-        # Validate workload config
-        if not config.workload.initial_sequence_lengths:
-            return False
-        if not config.workload.generation_steps:
-            return False
-        if any(x <= 0 for x in config.workload.initial_sequence_lengths):
-            return False
-        if any(x <= 0 for x in config.workload.generation_steps):
-            return False
-        if config.workload.precision_bytes <= 0:
-            return False
-        
-        # Validate algorithm config
-        if not 0 <= config.algorithm.migration_threshold <= 1:
-            return False
-        if config.algorithm.backtrack_limit <= 0:
-            return False
-        
-        # Validate experiment config
-        if config.experiment.num_runs <= 0:
-            return False
-        if config.experiment.checkpoint_interval <= 0:
-            return False
-        if config.experiment.time_limit <= 0:
-            return False
-        
-        return True
-    
-    except Exception:
+        return all(validator(config) for validator in _VALIDATORS)
+    except (AttributeError, TypeError):
+        # A section or field is missing entirely (e.g. a hand-built config),
+        # or a field holds a mis-typed value the comparisons reject (e.g. a
+        # null in the YAML); both mean the config is invalid, not an error.
         return False
 
 
+# Known field names per section, for deciding whether an override can take
+# the zero-copy merge path.
+_SECTION_FIELDS = {
+    section: frozenset(keys) for section, keys, _ in _SECTION_SERIALIZERS
+}
+
+
 def merge_configs(base_config: SimulationConfig, override_config: Dict) -> SimulationConfig:
     """
     Merge base configuration with overrides from a dictionary.
+
+    Overrides addressing known fields of the known top-level sections
+    ('network', 'resources', ...) are applied directly with
+    dataclasses.replace: only the overridden section dataclasses are
+    reallocated, unmodified sections are shared with the base config by
+    reference, and nothing is copied or re-parsed. Unknown keys fall back
+    to a full dict merge and re-parse.
     """
+    if all(isinstance(v, dict) and _SECTION_FIELDS.get(k, frozenset()).issuperset(v)
+           for k, v in override_config.items()):
+        updated_sections = {}
+        for section, overrides in override_config.items():
+            model_type = overrides.get('model_type')
+            if isinstance(model_type, str):
+                # Mirror from_dict: serialized overrides carry the enum
+                # name, e.g. "LARGE" => WorkloadType.LARGE.
+                overrides = {**overrides, 'model_type': WorkloadType[model_type]}
+            updated_sections[section] = replace(
+                getattr(base_config, section), **overrides
+            )
+        return replace(base_config, **updated_sections)
+
+    # Fallback for overrides outside the fixed section schema.
     base_dict = base_config.to_dict()
 
     def update_dict(d1: Dict, d2: Dict) -> Dict:
@@ -220,6 +220,61 @@ def test_config_serialization(simulation_config, tmp_path):
     loaded_json = load_config(json_path)
     assert loaded_json.to_dict() == simulation_config.to_dict()
 
+def test_config_load_caching(simulation_config, tmp_path):
+    """Test the (path, mtime, size) cache in load_config"""
+    config_path = tmp_path / "config.json"
+    save_config(simulation_config, config_path)
+
+    first = load_config(config_path)
+    second = load_config(config_path)
+    # Cache hits return equal but independent copies
+    assert first.to_dict() == second.to_dict()
+    assert first is not second
+
+    # Mutating a returned config must not leak into the cache
+    first.network.num_devices = 999
+    assert load_config(config_path).network.num_devices != 999
+
+    # Rewriting the file invalidates the cached entry
+    import os
+    simulation_config.network.num_devices = 16
+    save_config(simulation_config, config_path)
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_mtime_ns + 10**9, stat.st_mtime_ns + 10**9))
+    assert load_config(config_path).network.num_devices == 16
+
+    # The cache can be dropped explicitly
+    load_config.cache_clear()
+    assert load_config(config_path).network.num_devices == 16
+
+def test_yaml_sidecar_cache(simulation_config, tmp_path):
+    """Test the JSON sidecar cache written next to YAML configs"""
+    import os
+    yaml_path = tmp_path / "config.yaml"
+    sidecar_path = tmp_path / "config.yaml.cache.json"
+
+    save_config(simulation_config, yaml_path)
+    loaded = load_config(yaml_path)
+    assert sidecar_path.exists()
+    # The sidecar is complete, valid JSON matching the config
+    with open(sidecar_path) as f:
+        assert SimulationConfig.from_dict(json.load(f)).to_dict() == loaded.to_dict()
+
+    # A sidecar older than the YAML is ignored in favor of a fresh parse
+    simulation_config.network.num_devices = 16
+    save_config(simulation_config, yaml_path)
+    stat = yaml_path.stat()
+    os.utime(yaml_path, ns=(stat.st_mtime_ns + 10**9, stat.st_mtime_ns + 10**9))
+    load_config.cache_clear()
+    assert load_config(yaml_path).network.num_devices == 16
+
+    # A corrupt sidecar, even when newer, falls back to the YAML parse
+    sidecar_path.write_text("not json")
+    stat = yaml_path.stat()
+    os.utime(sidecar_path, ns=(stat.st_mtime_ns + 10**9, stat.st_mtime_ns + 10**9))
+    load_config.cache_clear()
+    assert load_config(yaml_path).network.num_devices == 16
+
 def test_config_validation(simulation_config):
     """Test configuration validation"""
     assert validate_config(simulation_config)
@@ -234,6 +289,20 @@ def test_config_validation(simulation_config):
     invalid_config.resources.memory_min = -1
     assert not validate_config(invalid_config)
 
+    # Test invalid workload config (lists reassigned after construction)
+    invalid_config = deepcopy(simulation_config)
+    invalid_config.workload.initial_sequence_lengths = [-1]
+    assert not validate_config(invalid_config)
+
+    invalid_config = deepcopy(simulation_config)
+    invalid_config.workload.generation_steps = [0]
+    assert not validate_config(invalid_config)
+
+    # Test mis-typed field (e.g. a null in the YAML source)
+    invalid_config = deepcopy(simulation_config)
+    invalid_config.network.num_devices = None
+    assert not validate_config(invalid_config)
+
 def test_config_merging():
     """Test configuration merging"""
     base_config = create_default_config()
@@ -247,6 +316,33 @@ def test_config_merging():
     assert merged.experiment.num_runs == 20
     # Other values should remain unchanged
     assert merged.network.topology_type == base_config.network.topology_type
+    # Untouched sections are shared with the base config by reference
+    assert merged.workload is base_config.workload
+
+def test_config_merging_model_type():
+    """Test that merging converts serialized model_type names to the enum"""
+    base_config = create_default_config()
+
+    merged = merge_configs(base_config, {'workload': {'model_type': 'LARGE'}})
+    assert merged.workload.model_type is WorkloadType.LARGE
+    assert merged.to_dict()['workload']['model_type'] == 'LARGE'
+    assert validate_config(merged)
+
+def test_config_merging_fallback_equivalence():
+    """Test that the fast merge path and the dict fallback agree"""
+    base_config = create_default_config()
+    override = {
+        'workload': {'model_type': 'LARGE'},
+        'network': {'num_devices': 16}
+    }
+
+    fast = merge_configs(base_config, override)
+    # An unknown key forces the full dict merge and re-parse path
+    fallback = merge_configs(
+        base_config,
+        {**override, 'workload': {**override['workload'], 'comment': 'x'}}
+    )
+    assert fast.to_dict() == fallback.to_dict()
 
 def test_default_config():
     """Test default configuration creation"""
@@ -174,6 +174,54 @@ def test_performance_report_creation(visualization_manager):
         assert 'resource_utilization' in report
         assert 'communication_statistics' in report
 
+def test_streaming_report_matches_dataframe_report(tmp_path):
+    """Test that the streaming JSONL report matches the DataFrame report"""
+    viz = VisualizationManager(output_dir=tmp_path, style='default')
+    metrics_data = pd.DataFrame({
+        'step': range(10),
+        'device_id': ['device_0', 'device_1'] * 5,
+        'latency': np.random.uniform(10, 100, 10),
+        'memory_utilization': np.random.uniform(0, 1, 10),
+        'compute_utilization': np.random.uniform(0, 1, 10),
+        'data_transferred': np.random.uniform(0, 10, 10),
+        'transfer_time': np.random.uniform(0, 5, 10),
+        'event_type': ['migration'] * 4 + ['computation'] * 6,
+        'migration_cost': np.random.uniform(0, 10, 10)
+    })
+    metrics_file = tmp_path / 'metrics.jsonl'
+    metrics_data.to_json(metrics_file, orient='records', lines=True)
+
+    df_report_file = tmp_path / 'report_df.json'
+    stream_report_file = tmp_path / 'report_stream.json'
+    viz.create_performance_report(metrics_data, df_report_file)
+    viz.create_performance_report_from_jsonl(metrics_file, stream_report_file)
+
+    with open(df_report_file) as f:
+        df_report = json.load(f)
+    with open(stream_report_file) as f:
+        stream_report = json.load(f)
+
+    # Identical schema and (up to float rounding) identical values,
+    # timestamps aside
+    df_report.pop('timestamp')
+    stream_report.pop('timestamp')
+    assert df_report.keys() == stream_report.keys()
+    for section in df_report:
+        assert df_report[section].keys() == stream_report[section].keys()
+    assert df_report['summary_statistics'] == pytest.approx(
+        stream_report['summary_statistics']
+    )
+    assert df_report['communication_statistics'] == pytest.approx(
+        stream_report['communication_statistics']
+    )
+    assert df_report['migration_statistics'] == pytest.approx(
+        stream_report['migration_statistics']
+    )
+    for metric in ('average_memory_utilization', 'average_compute_utilization'):
+        assert df_report['resource_utilization'][metric] == pytest.approx(
+            stream_report['resource_utilization'][metric]
+        )
+
 def test_plot_all_metrics(visualization_manager, tmp_path):
     """Test plotting all metrics"""
     # Create sample metrics data